@@ -9,8 +9,10 @@ def copy_rules(basedir):
 
 	for version, base_files in version_sets.items():
 		dest = os.path.join(basedir, 'version_sets', version)
-		if os.path.exists(dest):
+		try:
 			shutil.rmtree(dest)
+		except FileNotFoundError:
+			pass
 		pathlib.Path(dest).mkdir(parents=True)
 		for f in base_files:
 			src_file = os.path.join(basedir, 'base_rule_definitions', f)
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import Annotated, Optional, Union
 
 import yaml
@@ -15,6 +16,22 @@ from focus_validator.config_objects.common import (
     generate_check_friendly_name,
 )
 
+try:
+    # libyaml backed loader is significantly faster, not available in every build
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+@lru_cache(maxsize=512)
+def __read_rule_file__(rule_path, mtime_ns, size):
+    """
+    Parses rule config file, modification time and size are part of the cache key
+    so that a changed file is parsed again.
+    """
+    with open(rule_path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
 
 class InvalidRule(BaseModel):
     rule_path: str
@@ -80,11 +97,41 @@ class Rule(BaseModel):
     def load_yaml(
         rule_path, column_namespace: Optional[str] = None
     ) -> Union["Rule", InvalidRule]:
-        rule_path_basename = os.path.splitext(os.path.basename(rule_path))[0]
+        try:
+            stat = os.stat(rule_path)
+            rule_obj = __read_rule_file__(rule_path, stat.st_mtime_ns, stat.st_size)
+        except Exception as e:
+            return Rule.__invalid_rule__(rule_path=rule_path, error=e)
+
+        return Rule.__load_rule_obj__(
+            rule_path=rule_path, rule_obj=rule_obj, column_namespace=column_namespace
+        )
 
+    @staticmethod
+    def load_yaml_bytes(
+        rule_path, content: bytes, column_namespace: Optional[str] = None
+    ) -> Union["Rule", InvalidRule]:
+        """
+        Loads rule config from content that has already been read, rule_path is only
+        used to derive the default check_id and to reference errors.
+        """
         try:
-            with open(rule_path, "r") as f:
-                rule_obj = yaml.safe_load(f)
+            rule_obj = yaml.load(content, Loader=SafeLoader)
+        except Exception as e:
+            return Rule.__invalid_rule__(rule_path=rule_path, error=e)
+
+        return Rule.__load_rule_obj__(
+            rule_path=rule_path, rule_obj=rule_obj, column_namespace=column_namespace
+        )
+
+    @staticmethod
+    def __load_rule_obj__(
+        rule_path, rule_obj, column_namespace: Optional[str]
+    ) -> Union["Rule", InvalidRule]:
+        try:
+            if isinstance(rule_obj, dict):
+                # parsed object can be shared between calls, copy before modifying it
+                rule_obj = dict(rule_obj)
 
             if (
                 isinstance(rule_obj, dict)
@@ -94,15 +141,19 @@ class Rule(BaseModel):
                 rule_obj["column"] = f"{column_namespace}:{rule_obj['column']}"
 
             if isinstance(rule_obj, dict) and "check_id" not in rule_obj:
-                rule_obj["check_id"] = rule_path_basename
+                rule_obj["check_id"] = os.path.splitext(os.path.basename(rule_path))[0]
 
             return Rule.model_validate(rule_obj)
         except Exception as e:
-            return InvalidRule(
-                rule_path=rule_path_basename,
-                error=str(e),
-                error_type=e.__class__.__name__,
-            )
+            return Rule.__invalid_rule__(rule_path=rule_path, error=e)
+
+    @staticmethod
+    def __invalid_rule__(rule_path, error: Exception) -> InvalidRule:
+        return InvalidRule(
+            rule_path=os.path.splitext(os.path.basename(rule_path))[0],
+            error=str(error),
+            error_type=error.__class__.__name__,
+        )
 
 
 class ChecklistObject(BaseModel):
@@ -1,9 +1,581 @@
+import codecs
+import csv
+import io
+import os
+import stat
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+
+from focus_validator.exceptions import FocusNotImplementedError
+
+# pandas default missing value markers, pyarrow's defaults differ slightly
+NA_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+TRUE_VALUES = ["True", "TRUE", "true"]
+FALSE_VALUES = ["False", "FALSE", "false"]
+
+DEFAULT_CHUNKSIZE = 262144
+
+ENGINES = ["pyarrow", "pandas", "polars"]
+
+# smaller files are parsed faster by pandas, pyarrow's setup cost is not worth it
+PYARROW_MIN_SIZE = 1 << 20
+
+# string columns with fewer distinct values than this share of rows are categorical
+CATEGORY_RATIO = 0.5
+
+DELIMITERS = ",;\t|"
+HEAD_SIZE = 8192
+
+# pyarrow converts hexadecimal and explicitly positive numbers, pandas keeps
+# hexadecimal values as strings and reads +1 as an integer rather than a float
+NUMBER_PREFIX_PATTERN = r"^\s*(\+|0[xX])"
+# pyarrow reads NaN in any letter case, pandas only the spellings in NA_VALUES
+NAN_PATTERN = r"^\s*[+-]?nan\s*$"
+# pandas reads booleans in any letter case, pyarrow only TRUE_VALUES and FALSE_VALUES
+BOOLEAN_PATTERN = r"^(true|false)$"
+
+
+def __read_head__(source, start):
+    """
+    Reads and decodes the first bytes of the data, raises UnicodeDecodeError
+    before any parsing for data that is not utf-8, e.g. binary files.
+    """
+    if start is None:
+        with open(source, "rb") as f:
+            head = f.read(HEAD_SIZE)
+    else:
+        source.seek(start)
+        head = source.read(HEAD_SIZE)
+        source.seek(start)
+
+    # incremental decoder does not fail on a character cut off at the end
+    return codecs.getincrementaldecoder("utf-8")().decode(head)
+
+
+def __sniff_delimiter__(head):
+    """
+    Detects delimiter from the first lines of the data, falls back to comma when
+    the sample is ambiguous.
+    """
+    # partial last line would skew the per line delimiter counts
+    sample = head[: head.rfind("\n") + 1] or head
+
+    try:
+        delimiter = csv.Sniffer().sniff(sample, delimiters=DELIMITERS).delimiter
+    except csv.Error:
+        return ","
+
+    # e.g. single column files, a delimiter has to separate the column names
+    header = sample.split("\n", 1)[0]
+    return delimiter if delimiter in header else ","
+
+
+def __temporal_columns__(schema):
+    return [field.name for field in schema if pa.types.is_temporal(field.type)]
+
+
+def __arrow_column_types__(column_types):
+    """
+    Maps pandas dtypes to pyarrow types, returns None if any of them is not
+    converted the same way by both.
+    """
+    arrow_column_types = {}
+    for column_name, dtype in column_types.items():
+        try:
+            kind = np.dtype(dtype).kind
+        except TypeError:
+            # extension dtypes, e.g. category
+            return None
+
+        if kind in "iufb":
+            arrow_column_types[column_name] = pa.from_numpy_dtype(np.dtype(dtype))
+        elif kind in "OU":
+            arrow_column_types[column_name] = pa.string()
+        else:
+            return None
+    return arrow_column_types
+
+
+def __has_ambiguous_numbers__(source, start, parse_options, column_names):
+    """
+    Reads the numeric columns again as strings and checks whether any of the values
+    is converted differently by pandas.
+    """
+    if start is not None:
+        source.seek(start)
+    table = pacsv.read_csv(
+        source,
+        parse_options=parse_options,
+        convert_options=pacsv.ConvertOptions(
+            include_columns=column_names,
+            column_types=dict.fromkeys(column_names, pa.string()),
+        ),
+    )
+    na_values = pa.array(NA_VALUES)
+    for column in table.columns:
+        if pc.any(pc.match_substring_regex(column, NUMBER_PREFIX_PATTERN)).as_py():
+            return True
+        nan_values = pc.and_(
+            pc.match_substring_regex(column, NAN_PATTERN, ignore_case=True),
+            pc.invert(pc.is_in(column, value_set=na_values)),
+        )
+        if pc.any(nan_values).as_py():
+            return True
+    return False
+
+
+def __probe_schema__(source, start, parse_options, convert_options, columns):
+    """
+    Reads the schema inferred from the first block, returns None when pandas would
+    name or select the columns differently. Requested columns are included in the
+    order of the file, same as pandas.
+    """
+    if start is not None:
+        source.seek(start)
+    with pacsv.open_csv(
+        source, parse_options=parse_options, convert_options=convert_options
+    ) as reader:
+        schema = reader.schema
+
+    column_names = schema.names
+    if "" in column_names or len(set(column_names)) != len(column_names):
+        # pandas renames unnamed and duplicate columns
+        return None
+    if columns is not None:
+        if not set(columns).issubset(column_names):
+            # pandas raises an error for these
+            return None
+        convert_options.include_columns = [
+            column_name for column_name in column_names if column_name in columns
+        ]
+    return schema
+
+
+def __read_table__(
+    source, start, parse_options, convert_options, schema, requested_types
+):
+    """
+    Reads the table with date and time columns kept as strings, the whole file is
+    read again if a later block turns out to hold such values.
+    """
+    inferred_types = {}
+    while True:
+        if start is not None:
+            source.seek(start)
+        convert_options.column_types = {
+            **dict.fromkeys(__temporal_columns__(schema), pa.string()),
+            **inferred_types,
+            **requested_types,
+        }
+        table = pacsv.read_csv(
+            source, parse_options=parse_options, convert_options=convert_options
+        )
+
+        temporal_columns = __temporal_columns__(table.schema)
+        if not temporal_columns:
+            return table
+        inferred_types.update(dict.fromkeys(temporal_columns, pa.string()))
+
+
+def __fix_column_types__(table, requested_types):
+    """
+    Converts columns to the types pandas would use, returns None when a column
+    cannot be converted the same way.
+    """
+    for index, field in enumerate(table.schema):
+        if field.name in requested_types:
+            if (
+                pa.types.is_integer(field.type) or pa.types.is_boolean(field.type)
+            ) and table.column(index).null_count:
+                # pandas refuses missing values in integer and boolean columns
+                return None
+        elif pa.types.is_binary(field.type):
+            # not valid utf-8
+            return None
+        elif pa.types.is_floating(field.type):
+            # integers too large for int64 are kept as strings by pandas, pyarrow
+            # loads them as imprecise floats
+            max_value = pc.max(pc.abs(table.column(index))).as_py()
+            if max_value is not None and max_value >= 2**53:
+                return None
+        elif (
+            pa.types.is_string(field.type)
+            and pc.all(
+                pc.match_substring_regex(
+                    table.column(index), BOOLEAN_PATTERN, ignore_case=True
+                )
+            ).as_py()
+        ):
+            # e.g. tRuE, which pandas reads as a boolean
+            return None
+        elif pa.types.is_null(field.type) and table.num_rows:
+            # columns without any value are loaded as NaN floats by pandas
+            table = table.set_column(
+                index, field.name, table.column(index).cast(pa.float64())
+            )
+    return table
+
+
+def __read_csv_with_pyarrow__(
+    source, start, delimiter, columns=None, column_types=None
+):
+    """
+    Parses csv with the multithreaded pyarrow reader, returns None when the data
+    cannot be loaded the same way pandas.read_csv would load it.
+    """
+    requested_types = __arrow_column_types__(column_types or {})
+    if requested_types is None:
+        return None
+
+    parse_options = pacsv.ParseOptions(delimiter=delimiter)
+    convert_options = pacsv.ConvertOptions(
+        null_values=NA_VALUES,
+        true_values=TRUE_VALUES,
+        false_values=FALSE_VALUES,
+        strings_can_be_null=True,
+    )
+
+    try:
+        # pandas keeps date and time values as strings and checks rely on the raw
+        # values, types inferred from the first block catch most of these columns
+        schema = __probe_schema__(
+            source, start, parse_options, convert_options, columns
+        )
+        if schema is None:
+            return None
+        table = __read_table__(
+            source, start, parse_options, convert_options, schema, requested_types
+        )
+    except pa.ArrowInvalid:
+        # e.g. empty file, rows with extra fields or values not matching inferred type
+        return None
+
+    numeric_columns = [
+        field.name
+        for field in table.schema
+        if field.name not in requested_types
+        and (pa.types.is_integer(field.type) or pa.types.is_floating(field.type))
+    ]
+    if numeric_columns and __has_ambiguous_numbers__(
+        source, start, parse_options, numeric_columns
+    ):
+        return None
+
+    table = __fix_column_types__(table, requested_types)
+    if table is None:
+        return None
+
+    data = table.to_pandas()
+    for field in table.schema:
+        if data[field.name].dtype == object and table[field.name].null_count:
+            # pyarrow converts missing strings to None, pandas uses NaN
+            data[field.name] = data[field.name].fillna(np.nan)
+    return data
+
+
+def __read_csv_with_polars__(source, delimiter, columns, column_types):
+    """
+    Parses csv with polars, unlike pandas values are not trimmed and only
+    converted to numbers when the whole column is numeric.
+    """
+    polars_data = pl.read_csv(
+        source,
+        separator=delimiter,
+        columns=columns,
+        null_values=NA_VALUES,
+        infer_schema_length=None,
+    )
+
+    data = polars_data.to_pandas()
+    for column_name, null_count in zip(
+        polars_data.columns, polars_data.null_count().row(0)
+    ):
+        if data[column_name].dtype == object and null_count:
+            # missing strings are converted to None, pandas uses NaN
+            data[column_name] = data[column_name].fillna(np.nan)
+
+    if column_types:
+        data = data.astype(
+            {
+                column_name: dtype
+                for column_name, dtype in column_types.items()
+                if column_name in data.columns
+            }
+        )
+    return data
+
+
+def __read_csv__(source, start, engine, delimiter, columns, column_types):
+    if engine == "polars":
+        if start is not None:
+            # polars reads buffers from their beginning
+            source.seek(start)
+            source = source.read()
+        return __read_csv_with_polars__(source, delimiter, columns, column_types)
+
+    if engine == "pyarrow":
+        data = __read_csv_with_pyarrow__(
+            source, start, delimiter, columns, column_types
+        )
+        if data is not None:
+            return data
+        if start is not None:
+            source.seek(start)
+
+    return pd.read_csv(source, sep=delimiter, usecols=columns, dtype=column_types)
+
+
+def __downcast__(data):
+    """
+    Converts integer columns to the smallest integer type that holds their values
+    and string columns with few distinct values to categoricals.
+    """
+    for column_name, dtype in data.dtypes.items():
+        if dtype.kind in "iu":
+            data[column_name] = pd.to_numeric(data[column_name], downcast="integer")
+        elif (
+            dtype == object
+            and len(data)
+            and data[column_name].nunique() / len(data) < CATEGORY_RATIO
+        ):
+            data[column_name] = data[column_name].astype("category")
+    return data
+
+
+@lru_cache(maxsize=4)
+def __read_csv_file__(
+    data_path, mtime_ns, size, engine, delimiter, columns, column_types
+):
+    """
+    Parses csv file, modification time and size are part of the cache key so that
+    a changed file is parsed again.
+    """
+    head = __read_head__(data_path, None)
+    if delimiter is None:
+        delimiter = __sniff_delimiter__(head)
+    if columns is not None:
+        columns = list(columns)
+    if column_types is not None:
+        column_types = dict(column_types)
+
+    if engine == "pyarrow":
+        # parsed straight from the page cache, without copying the file into memory
+        with pa.memory_map(data_path) as source:
+            data = __read_csv_with_pyarrow__(
+                source, 0, delimiter, columns, column_types
+            )
+        if data is not None:
+            return data
+        engine = "pandas"
+
+    return __read_csv__(data_path, None, engine, delimiter, columns, column_types)
 
 
 class CSVDataLoader:
-    def __init__(self, data_filename):
+    def __init__(
+        self,
+        data_filename,
+        column_types=None,
+        columns=None,
+        delimiter=None,
+        engine="pyarrow",
+        downcast=False,
+        cache=False,
+    ):
+        """
+        Optional column_types maps column names to dtypes and columns limits which
+        columns are loaded, both skip type inference and conversion of values that
+        are not needed. Delimiter is detected from the data unless given.
+
+        By default data is parsed with pyarrow, which falls back to pandas for data
+        it cannot load the same way and for files smaller than PYARROW_MIN_SIZE,
+        engine can also be set to pandas or polars.
+
+        With downcast integer columns use the smallest type that holds their values
+        and repetitive string columns are loaded as categoricals to save memory.
+
+        With cache files loaded by path are kept in memory and a file that has not
+        changed is not parsed again, at the cost of a copy per load.
+        """
+        if engine not in ENGINES:
+            raise FocusNotImplementedError(f"CSV engine {engine} not implemented.")
+
         self.data_filename = data_filename
+        self.column_types = column_types
+        self.columns = columns
+        self.delimiter = delimiter
+        self.engine = engine
+        self.downcast = downcast
+        self.cache = cache
 
     def load(self):
-        return pd.read_csv(self.data_filename)
+        data = self.__load__()
+        if self.downcast:
+            data = __downcast__(data)
+        return data
+
+    def __load__(self):
+        source = self.data_filename
+
+        if isinstance(source, (str, os.PathLike)):
+            try:
+                file_stat = os.stat(source)
+            except OSError:
+                # e.g. urls, anything pandas cannot read raises its usual error
+                return self.__read_csv_with_pandas__(source)
+            if not stat.S_ISREG(file_stat.st_mode):
+                # e.g. pipes, which cannot be read more than once
+                return self.__read_csv_with_pandas__(source)
+
+            engine = self.engine
+            if engine == "pyarrow" and file_stat.st_size < PYARROW_MIN_SIZE:
+                engine = "pandas"
+
+            if self.cache:
+                read_csv_file = __read_csv_file__
+            else:
+                read_csv_file = __read_csv_file__.__wrapped__
+
+            data = read_csv_file(
+                os.path.realpath(source),
+                file_stat.st_mtime_ns,
+                file_stat.st_size,
+                engine,
+                self.delimiter,
+                None if self.columns is None else tuple(self.columns),
+                None if self.column_types is None else tuple(self.column_types.items()),
+            )
+            # cached frame is copied so callers can modify the returned data
+            return data.copy() if self.cache else data
+
+        if not isinstance(source, io.TextIOBase) and source.seekable():
+            start = source.tell()
+            head = __read_head__(source, start)
+            return __read_csv__(
+                source,
+                start,
+                self.engine,
+                self.delimiter or __sniff_delimiter__(head),
+                self.columns,
+                self.column_types,
+            )
+        return self.__read_csv_with_pandas__(source)
+
+    def load_iter(self, chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Yields data in frames of at most chunksize rows, so that memory use is bound
+        by the chunk size rather than by the size of the file.
+        """
+        source = self.data_filename
+        if isinstance(source, (str, os.PathLike)):
+            delimiter = self.delimiter
+            if delimiter is None and os.path.isfile(source):
+                delimiter = __sniff_delimiter__(__read_head__(source, None))
+        elif not isinstance(source, io.TextIOBase) and source.seekable():
+            delimiter = self.delimiter or __sniff_delimiter__(
+                __read_head__(source, source.tell())
+            )
+        else:
+            delimiter = self.delimiter
+
+        with pd.read_csv(
+            source,
+            sep=delimiter or ",",
+            chunksize=chunksize,
+            usecols=self.columns,
+            dtype=self.column_types,
+        ) as reader:
+            yield from reader
+
+    def load_dataset(self):
+        """
+        Returns the file as a pyarrow dataset, which is only parsed when read, so
+        callers can read a subset of columns or rows without loading the rest,
+        e.g. load_dataset().to_table(columns=[...]).to_pandas().
+
+        Missing value markers are the same as in load() and date and time values
+        are kept as strings, other values are converted by pyarrow and can differ
+        from load(), which matches pandas.read_csv:
+        - hexadecimal numbers, numbers with a leading + and NaN in letter cases
+          other than those in NA_VALUES are read as numbers
+        - booleans are only read in the letter cases of TRUE_VALUES and
+          FALSE_VALUES
+        - integers too large for int64 are read as floats
+        - columns without any value are null rather than float columns
+        - missing strings are None rather than NaN
+        """
+        source = self.data_filename
+        if not isinstance(source, (str, os.PathLike)):
+            raise FocusNotImplementedError("Dataset of a buffer not implemented yet.")
+
+        requested_types = __arrow_column_types__(self.column_types or {})
+        if requested_types is None:
+            raise FocusNotImplementedError("Dataset column type not implemented yet.")
+
+        parse_options = pacsv.ParseOptions(
+            delimiter=self.delimiter or __sniff_delimiter__(__read_head__(source, None))
+        )
+        convert_options = pacsv.ConvertOptions(
+            null_values=NA_VALUES,
+            true_values=TRUE_VALUES,
+            false_values=FALSE_VALUES,
+            strings_can_be_null=True,
+        )
+
+        # checks rely on the raw date and time values
+        with pacsv.open_csv(
+            source, parse_options=parse_options, convert_options=convert_options
+        ) as reader:
+            schema = reader.schema
+        convert_options.column_types = {
+            **dict.fromkeys(__temporal_columns__(schema), pa.string()),
+            **requested_types,
+        }
+        if self.columns is not None:
+            convert_options.include_columns = [
+                column_name
+                for column_name in schema.names
+                if column_name in self.columns
+            ]
+
+        return ds.dataset(
+            source,
+            format=ds.CsvFileFormat(
+                parse_options=parse_options, convert_options=convert_options
+            ),
+        )
+
+    def __read_csv_with_pandas__(self, source):
+        return pd.read_csv(
+            source,
+            sep=self.delimiter or ",",
+            usecols=self.columns,
+            dtype=self.column_types,
+        )
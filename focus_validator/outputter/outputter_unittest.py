@@ -1,6 +1,7 @@
 import logging
 import sys
 import xml.etree.cElementTree as ET
+from collections import Counter
 from datetime import datetime, timezone
 
 
@@ -113,11 +114,11 @@ class UnittestOutputter:
 
     def write(self, result_set):
         # First generate the summary
-        result_statuses = {}
-        for status in ["passed", "failed", "skipped", "errored"]:
-            result_statuses[status] = sum(
-                [1 for r in result_set.checklist.values() if r.status.value == status]
-            )
+        status_counts = Counter(r.status.value for r in result_set.checklist.values())
+        result_statuses = {
+            status: status_counts[status]
+            for status in ["passed", "failed", "skipped", "errored"]
+        }
 
         # format the results for processing
         rows = [v.model_dump() for v in result_set.checklist.values()]
@@ -11,6 +11,13 @@ from pandera.errors import SchemaError
 
 from focus_validator.utils.download_currency_codes import get_currency_codes
 
+try:
+    # pysimdjson is an optional dependency, its parser does not materialize nested
+    # values unless they are accessed which is all that is needed to check the type
+    import simdjson
+except ImportError:  # pragma: no cover
+    simdjson = None  # type: ignore[assignment]
+
 
 def is_camel_case(column_name):
     return (
@@ -38,14 +45,8 @@ def check_value_in(pandas_obj: pd.Series, allowed_values):
 
 @extensions.register_check_method(check_type="groupby")
 def check_sql_query(df_groups, sql_query, column_alias):
-    grouped_elements = []
-    for values in list(df_groups):
-        row_obj = {}
-        for column_name, value in zip(column_alias + ["index"], values):
-            row_obj[column_name] = value
-        grouped_elements.append(row_obj)
-
-    df = pd.DataFrame(grouped_elements)
+    column_names = column_alias + ["index"]
+    df = pd.DataFrame([dict(zip(column_names, values)) for values in df_groups])
     check_output = pandasql.sqldf(sql_query, locals())["check_output"]
 
     # Getting the index of rows where the series values are False
@@ -97,7 +98,7 @@ def check_datetime_dtype(pandas_obj: pd.Series):
 
 @extensions.register_check_method()
 def check_currency_code_dtype(pandas_obj: pd.Series):
-    currency_codes = set(get_currency_codes())
+    currency_codes = get_currency_codes()
     return pd.Series(
         map(lambda v: isinstance(v, str) and v in currency_codes, pandas_obj.values)
     )
@@ -105,10 +106,27 @@ def check_currency_code_dtype(pandas_obj: pd.Series):
 
 @extensions.register_check_method()
 def check_stringified_json_object_dtype(pandas_obj: pd.Series):
+    if simdjson is not None:
+        parser = simdjson.Parser()
+
+        def __is_json_object__(value: str):
+            if value.startswith("\ufeff"):
+                # pysimdjson skips a byte order mark, stdlib json rejects it
+                return isinstance(json.loads(value), dict)
+            try:
+                return isinstance(parser.parse(value), simdjson.Object)
+            except (ValueError, RuntimeError):
+                # e.g. integers beyond 64 bits or NaN, which stdlib json accepts
+                return isinstance(json.loads(value), dict)
+
+    else:
+
+        def __is_json_object__(value: str):
+            return isinstance(json.loads(value), dict)
+
     def __validate_stringified_json_object__(value: str):
         try:
-            parsed = json.loads(value)
-            return isinstance(parsed, dict)
+            return __is_json_object__(value)
         except Exception:
             return False
 
@@ -127,7 +127,9 @@ class SpecRules:
         self.column_namespace = column_namespace
 
     def supported_versions(self):
-        return sorted([x for x in os.walk(self.rule_set_path)][0][1])
+        # only the top level directories are versions, no need to walk the rule files
+        with os.scandir(self.rule_set_path) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir())
 
     def load(self):
         self.load_overrides()
@@ -1,4 +1,5 @@
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 
 import pandas as pd
 import requests
@@ -20,9 +21,11 @@ def download_currency_codes():  # pragma: no cover
     df.to_csv(CURRENCY_CODE_CSV_PATH)
 
 
+@lru_cache(maxsize=None)
 def get_currency_codes():
+    # list does not change during a run, parse it once and share the immutable set
     df = pd.read_csv(CURRENCY_CODE_CSV_PATH)
-    return set(df["currency_codes"].values)
+    return frozenset(df["currency_codes"].values)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,4 +1,5 @@
 from unittest import TestCase
+from unittest.mock import patch
 from uuid import uuid4
 
 import pandas as pd
@@ -13,12 +14,23 @@ from focus_validator.config_objects.common import (
 from focus_validator.config_objects.focus_to_pandera_schema_converter import (
     FocusToPanderaSchemaConverter,
 )
+from focus_validator.rules import checks
 from focus_validator.rules.spec_rules import ValidationResult
 
+# values are parsed with pysimdjson when the speedups extra is installed and with
+# stdlib json otherwise, results must not depend on which one is used
+JSON_PARSERS = [None] if checks.simdjson is None else [checks.simdjson, None]
+
 
 # noinspection DuplicatedCode
 class TestAttributeJSONObject(TestCase):
     def __eval_function__(self, sample_value, should_fail):
+        for json_parser in JSON_PARSERS:
+            with self.subTest(json_parser=json_parser):
+                with patch.object(checks, "simdjson", json_parser):
+                    self.__eval_function_with_parser__(sample_value, should_fail)
+
+    def __eval_function_with_parser__(self, sample_value, should_fail):
         random_column_id = str(uuid4())
         random_check_id = str(uuid4())
 
@@ -76,3 +88,30 @@ class TestAttributeJSONObject(TestCase):
 
     def test_valid_json_empty_string(self):
         self.__eval_function__("", True)
+
+    def test_valid_json_array(self):
+        self.__eval_function__('[{"my-cool-tag": "focus"}]', True)
+
+    def test_valid_json_non_ascii(self):
+        self.__eval_function__('{"región": "España", "coste": "€", "测试": "数据"}', False)
+
+    def test_valid_json_big_integer(self):
+        self.__eval_function__('{"a": 123456789012345678901234567890}', False)
+
+    def test_valid_json_integer_below_int64(self):
+        self.__eval_function__('{"a": -9223372036854775809}', False)
+
+    def test_valid_json_nan(self):
+        self.__eval_function__('{"a": NaN}', False)
+
+    def test_valid_json_number_out_of_double_range(self):
+        self.__eval_function__('{"a": 1e400}', False)
+
+    def test_valid_json_lone_surrogate(self):
+        self.__eval_function__('{"a": "\\ud800"}', False)
+
+    def test_valid_json_with_bom(self):
+        self.__eval_function__('\ufeff{"a": 1}', True)
+
+    def test_valid_json_invalid(self):
+        self.__eval_function__('{"a": }', True)
@@ -1,9 +1,8 @@
-import tempfile
+import io
 from datetime import datetime
 from unittest import TestCase
 from uuid import uuid4
 
-import pytz
 import pandas as pd
 import pytz
 from pandera.errors import SchemaErrors
@@ -81,10 +80,10 @@ class TestDatetimeColumnLoadFromCSV(TestCase):
 
         sample_df = pd.DataFrame([{random_column_id: utc_datetime}])
 
-        with tempfile.NamedTemporaryFile(suffix=".csv", mode="r+") as temp_file:
-            sample_df.to_csv(temp_file)
-            temp_file.seek(0)
-            read_df = pd.read_csv(temp_file)
+        buffer = io.StringIO()
+        sample_df.to_csv(buffer)
+        buffer.seek(0)
+        read_df = pd.read_csv(buffer)
 
         self.__assert_values__(
             random_column_id=random_column_id,
@@ -103,10 +102,10 @@ class TestDatetimeColumnLoadFromCSV(TestCase):
 
         sample_df = pd.DataFrame([{random_column_id: naive_datetime}])
 
-        with tempfile.NamedTemporaryFile(suffix=".csv", mode="r+") as temp_file:
-            sample_df.to_csv(temp_file)
-            temp_file.seek(0)
-            read_df = pd.read_csv(temp_file)
+        buffer = io.StringIO()
+        sample_df.to_csv(buffer)
+        buffer.seek(0)
+        read_df = pd.read_csv(buffer)
 
         self.__assert_values__(
             random_column_id=random_column_id,
@@ -128,11 +127,11 @@ class TestDatetimeColumnLoadFromCSV(TestCase):
         # generate random dataframe
         sample_df = pd.DataFrame([{random_column_id: aware_datetime}])
 
-        with tempfile.NamedTemporaryFile(suffix=".csv", mode="r+") as temp_file:
-            # write csv to temporary location and read to simulate df read
-            sample_df.to_csv(temp_file)
-            temp_file.seek(0)
-            read_df = pd.read_csv(temp_file)
+        # write csv to an in-memory buffer and read to simulate df read
+        buffer = io.StringIO()
+        sample_df.to_csv(buffer)
+        buffer.seek(0)
+        read_df = pd.read_csv(buffer)
 
         self.__assert_values__(
             random_column_id=random_column_id,
@@ -153,11 +152,11 @@ class TestDatetimeColumnLoadFromCSV(TestCase):
         # generate random dataframe
         sample_df = pd.DataFrame([{random_column_id: bad_value}])
 
-        with tempfile.NamedTemporaryFile(suffix=".csv", mode="r+") as temp_file:
-            # write csv to temporary location and read to simulate df read
-            sample_df.to_csv(temp_file)
-            temp_file.seek(0)
-            read_df = pd.read_csv(temp_file)
+        # write csv to an in-memory buffer and read to simulate df read
+        buffer = io.StringIO()
+        sample_df.to_csv(buffer)
+        buffer.seek(0)
+        read_df = pd.read_csv(buffer)
 
         self.__assert_values__(
             random_column_id=random_column_id,
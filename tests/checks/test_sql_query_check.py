@@ -1,4 +1,3 @@
-import json
 from unittest import TestCase
 
 import pandas as pd
@@ -58,12 +57,11 @@ class TestSQLQueryCheck(TestCase):
     def test_sql_check_for_multiple_columns(self):
         test_sql_query = "SELECT * FROM table"
 
-        with self.assertRaises(ValidationError) as cm:
-            SQLQueryCheck(sql_query=test_sql_query)
-        self.assertIn(
+        with self.assertRaisesRegex(
+            ValidationError,
             "Assertion failed, SQL query must only return a column called 'check_output'",
-            str(cm.exception),
-        )
+        ):
+            SQLQueryCheck(sql_query=test_sql_query)
 
     def test_sql_check_with_invalid_sql(self):
         """
@@ -1,5 +1,3 @@
-import os
-import tempfile
 from unittest import TestCase
 
 import pandas as pd
@@ -12,7 +10,7 @@ from focus_validator.config_objects.focus_to_pandera_schema_converter import (
 )
 from focus_validator.rules.spec_rules import ValidationResult
 
-YAML_CONFIG = """
+YAML_CONFIG = b"""
 check_id: SkuPriceId
 column_id: SkuPriceId
 check_friendly_name: SkuPriceId must be set for certain values of ChargeType
@@ -28,13 +26,7 @@ check:
 
 class TestSQLQueryCheckConfig(TestCase):
     def test_config_from_yaml(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            sample_file_path = os.path.join(temp_dir, "D001_S001.yaml")
-
-            with open(sample_file_path, "w") as fd:
-                fd.write(YAML_CONFIG)
-
-            rule = Rule.load_yaml(sample_file_path)
+        rule = Rule.load_yaml_bytes("D001_S001.yaml", YAML_CONFIG)
 
         dimension_checks = [
             Rule(
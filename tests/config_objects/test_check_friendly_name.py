@@ -15,7 +15,7 @@ from focus_validator.config_objects.common import (
 
 class TestCheckFriendlyName(TestCase):
     def test_default_friendly_name_is_generated(self):
-        random_column_name = str(uuid4())
+        random_column_name = uuid4().hex
 
         model_factory = ModelFactory.create_factory(
             model=Rule, check_friendly_name=None, column_id=random_column_name
@@ -71,7 +71,7 @@ class TestCheckFriendlyName(TestCase):
                 )
 
     def test_override_friendly_name(self):
-        random_friendly_name = str(uuid4())
+        random_friendly_name = uuid4().hex
 
         sample_rule = Rule(
             check="check_unique",
@@ -72,12 +72,8 @@ class TestCheckTypeFriendlyName(TestCase):
             else:
                 raise e
 
-        with self.assertRaises(ValidationError) as cm:
+        with self.assertRaisesRegex(ValidationError, "Instance is frozen"):
             sample_data_type.check_type_friendly_name = "new_value"
-        self.assertIn(
-            "Instance is frozen",
-            str(cm.exception),
-        )
 
     def test_assign_bad_type(self):
         with self.assertRaises(ValidationError) as cm:
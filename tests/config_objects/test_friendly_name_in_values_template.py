@@ -13,12 +13,12 @@ from focus_validator.config_objects.focus_to_pandera_schema_converter import (
 class TestFriendlyNameInValuesTemplate(TestCase):
     def test_check_value_in(self):
         rule = Rule(
-            check_id=str(uuid4()),
-            column_id=str(uuid4()),
+            check_id=uuid4().hex,
+            column_id=uuid4().hex,
             check=ValueInCheck(value_in=["foo", "bar"]),
             check_friendly_name="Values in {values}",
         )
         pa_check = FocusToPanderaSchemaConverter.__generate_pandera_check__(
-            rule=rule, check_id=str(uuid4())
+            rule=rule, check_id=uuid4().hex
         )
         self.assertIsInstance(pa_check, pa.Check)
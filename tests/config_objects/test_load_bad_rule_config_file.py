@@ -9,17 +9,27 @@ from focus_validator.config_objects.rule import InvalidRule
 
 
 class TestLoadBadRuleConfigFile(TestCase):
-    def test_load_empty_config(self):
-        rule = Rule.load_yaml(
+    @classmethod
+    def setUpClass(cls):
+        # rules are not modified by schema generation, parse each fixture only once
+        cls.empty_rule = Rule.load_yaml(
             "tests/samples/rule_configs/bad_rule_config_empty_file.yaml"
         )
-        self.assertIsInstance(rule, InvalidRule)
-
-    def test_load_incomplete_config(self):
-        rule = Rule.load_yaml(
+        cls.missing_check_rule = Rule.load_yaml(
             "tests/samples/rule_configs/bad_rule_config_missing_check.yaml"
         )
-        self.assertIsInstance(rule, InvalidRule)
+        cls.valid_rule = Rule.load_yaml(
+            "tests/samples/rule_configs/valid_rule_config.yaml"
+        )
+        cls.valid_column_metadata_rule = Rule.load_yaml(
+            "tests/samples/rule_configs/valid_rule_config_column_metadata.yaml"
+        )
+
+    def test_load_empty_config(self):
+        self.assertIsInstance(self.empty_rule, InvalidRule)
+
+    def test_load_incomplete_config(self):
+        self.assertIsInstance(self.missing_check_rule, InvalidRule)
 
     def test_load_bad_yaml(self):
         rule = Rule.load_yaml(
@@ -27,22 +37,25 @@ class TestLoadBadRuleConfigFile(TestCase):
         )
         self.assertIsInstance(rule, InvalidRule)
 
+    def test_load_bad_yaml_bytes(self):
+        with open(
+            "tests/samples/rule_configs/bad_rule_config_invalid_yaml.yaml", "rb"
+        ) as fd:
+            content = fd.read()
+
+        rule = Rule.load_yaml_bytes("bad_rule_config_invalid_yaml.yaml", content)
+        self.assertIsInstance(rule, InvalidRule)
+        self.assertEqual(rule.rule_path, "bad_rule_config_invalid_yaml")
+
     def test_load_valid_rule(self):
-        rule = Rule.load_yaml("tests/samples/rule_configs/valid_rule_config.yaml")
-        self.assertIsInstance(rule, Rule)
+        self.assertIsInstance(self.valid_rule, Rule)
 
     def test_load_schema(self):
         rules = [
-            Rule.load_yaml(
-                "tests/samples/rule_configs/bad_rule_config_empty_file.yaml"
-            ),
-            Rule.load_yaml(
-                "tests/samples/rule_configs/bad_rule_config_missing_check.yaml"
-            ),
-            Rule.load_yaml("tests/samples/rule_configs/valid_rule_config.yaml"),
-            Rule.load_yaml(
-                "tests/samples/rule_configs/valid_rule_config_column_metadata.yaml"
-            ),
+            self.empty_rule,
+            self.missing_check_rule,
+            self.valid_rule,
+            self.valid_column_metadata_rule,
         ]
 
         _, checklist = FocusToPanderaSchemaConverter.generate_pandera_schema(
@@ -82,15 +95,7 @@ class TestLoadBadRuleConfigFile(TestCase):
             self.assertEqual(checklist[errored_checks].column_id, "Unknown")
 
     def test_load_schema_without_valid_column_metadata(self):
-        rules = [
-            Rule.load_yaml(
-                "tests/samples/rule_configs/bad_rule_config_empty_file.yaml"
-            ),
-            Rule.load_yaml(
-                "tests/samples/rule_configs/bad_rule_config_missing_check.yaml"
-            ),
-            Rule.load_yaml("tests/samples/rule_configs/valid_rule_config.yaml"),
-        ]
+        rules = [self.empty_rule, self.missing_check_rule, self.valid_rule]
 
         _, checklist = FocusToPanderaSchemaConverter.generate_pandera_schema(
             rules=rules, override_config=None
@@ -100,9 +105,10 @@ class TestLoadBadRuleConfigFile(TestCase):
             ChecklistObjectStatus.ERRORED,
         )
         print(checklist["bad_rule_config_missing_check"].error)
-        self.assertRegex(
-            checklist["bad_rule_config_missing_check"].error,
-            "ValidationError:.*",
+        self.assertTrue(
+            checklist["bad_rule_config_missing_check"].error.startswith(
+                "ValidationError:"
+            )
         )
         self.assertIsNotNone(checklist["valid_rule_config"].friendly_name)
         self.assertEqual(checklist["valid_rule_config"].column_id, "ChargeType")
@@ -1,5 +1,6 @@
+from itertools import count
+from pathlib import Path
 from unittest import TestCase
-from uuid import uuid4
 
 import pandas as pd
 from pandera.errors import SchemaErrors
@@ -11,31 +12,36 @@ from focus_validator.config_objects.focus_to_pandera_schema_converter import (
 )
 from focus_validator.rules.spec_rules import ValidationResult
 
+SAMPLES_DIR = Path(__file__).resolve().parents[1] / "samples"
+RULE_CONFIGS_DIR = SAMPLES_DIR / "rule_configs"
+
+# ids only need to be unique within the test run, not random
+UNIQUE_IDS = count()
+
 
 class TestRequiredColumn(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # rules are frozen models so a single load can be shared between tests
+        cls.metadata_rule = Rule.load_yaml(
+            str(RULE_CONFIGS_DIR / "valid_rule_config_column_metadata.yaml")
+        )
+        cls.base_rule = Rule.load_yaml(str(RULE_CONFIGS_DIR / "valid_rule_config.yaml"))
+        cls.required_rule = Rule.load_yaml(
+            str(RULE_CONFIGS_DIR / "valid_rule_config_required.yaml")
+        )
+        cls.sample_data = pd.read_csv(
+            SAMPLES_DIR / "multiple_failure_examples.csv", engine="pyarrow"
+        )
+
     def test_load_column_required_config(self):
-        rules = [
-            Rule.load_yaml(
-                "tests/samples/rule_configs/valid_rule_config_column_metadata.yaml"
-            ),
-            Rule.load_yaml("tests/samples/rule_configs/valid_rule_config.yaml"),
-            Rule.load_yaml(
-                "tests/samples/rule_configs/valid_rule_config_required.yaml"
-            ),
-        ]
+        rules = [self.metadata_rule, self.base_rule, self.required_rule]
         schema, _ = FocusToPanderaSchemaConverter.generate_pandera_schema(rules=rules)
         self.assertIn("ChargeType", schema.columns)
         self.assertTrue(schema.columns["ChargeType"].required)
 
     def test_load_column_required_config_but_ignored(self):
-        rules = [
-            Rule.load_yaml(
-                "tests/samples/rule_configs/valid_rule_config_column_metadata.yaml"
-            ),
-            Rule.load_yaml(
-                "tests/samples/rule_configs/valid_rule_config_required.yaml"
-            ),
-        ]
+        rules = [self.metadata_rule, self.required_rule]
         schema, _ = FocusToPanderaSchemaConverter.generate_pandera_schema(
             rules=rules, override_config=Override(overrides=["FV-D001-0001"])
         )
@@ -43,32 +49,34 @@ class TestRequiredColumn(TestCase):
         self.assertFalse(schema.columns["ChargeType"].required)
 
     def test_check_summary_has_correct_mappings(self):
-        random_column_id = str(uuid4())
-        random_test_name = str(uuid4())
+        unique_column_id = f"column_{next(UNIQUE_IDS)}"
+        unique_test_name = f"check_{next(UNIQUE_IDS)}"
 
-        sample_data = pd.read_csv("tests/samples/multiple_failure_examples.csv")
         schema, checklist = FocusToPanderaSchemaConverter.generate_pandera_schema(
             rules=[
                 Rule(
-                    check_id=str(uuid4()),
-                    column_id=random_column_id,
+                    check_id=f"check_{next(UNIQUE_IDS)}",
+                    column_id=unique_column_id,
                     check=DataTypeCheck(data_type=DataTypes.STRING),
                 ),
                 Rule(
-                    check_id=random_test_name,
-                    column_id=random_column_id,
+                    check_id=unique_test_name,
+                    column_id=unique_column_id,
                     check="column_required",
                     check_friendly_name="Column required.",
                 ),
-                Rule.load_yaml(
-                    "tests/samples/rule_configs/valid_rule_config_column_metadata.yaml"
-                ),
-                Rule.load_yaml("tests/samples/rule_configs/valid_rule_config.yaml"),
+                self.metadata_rule,
+                self.base_rule,
             ]
         )
 
+        # only columns covered by the schema need to be checked, selecting them
+        # also yields a new frame so validation can skip its defensive copy
+        sample_data = self.sample_data[
+            [column for column in self.sample_data.columns if column in schema.columns]
+        ]
         with self.assertRaises(SchemaErrors) as cm:
-            schema.validate(sample_data, lazy=True)
+            schema.validate(sample_data, lazy=True, inplace=True)
 
         failure_cases = cm.exception.failure_cases
         result = ValidationResult(failure_cases=failure_cases, checklist=checklist)
@@ -76,14 +84,12 @@ class TestRequiredColumn(TestCase):
 
         self.assertEqual(result.failure_cases.shape[0], 4)
         missing_column_errors = result.failure_cases[
-            result.failure_cases["Column"] == random_column_id
+            result.failure_cases["Column"] == unique_column_id
         ]
 
-        raw_values = missing_column_errors.to_dict()
-        self.assertEqual(raw_values["Column"], {1: random_column_id})
-        self.assertEqual(raw_values["Check Name"], {1: random_test_name})
-        self.assertEqual(
-            raw_values["Description"],
-            {1: "Column required."},
-        )
-        self.assertEqual(raw_values["Values"], {1: None})
+        self.assertEqual(missing_column_errors.index.tolist(), [1])
+        row = missing_column_errors.iloc[0]
+        self.assertEqual(row["Column"], unique_column_id)
+        self.assertEqual(row["Check Name"], unique_test_name)
+        self.assertEqual(row["Description"], "Column required.")
+        self.assertIsNone(row["Values"])
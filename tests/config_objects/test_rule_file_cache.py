@@ -0,0 +1,32 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from focus_validator.config_objects import Rule
+from focus_validator.config_objects.common import DataTypeCheck, DataTypes
+
+
+class TestRuleFileCache(TestCase):
+    def test_load_same_file_twice(self):
+        rule_path = "tests/samples/rule_configs/valid_rule_config_column_metadata.yaml"
+
+        first = Rule.load_yaml(rule_path)
+        second = Rule.load_yaml(rule_path)
+
+        self.assertIsInstance(first, Rule)
+        self.assertEqual(first, second)
+        self.assertEqual(second.check_id, "valid_rule_config_column_metadata")
+
+    def test_load_modified_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            rule_path = os.path.join(temp_dir, "D001_S001.yaml")
+
+            with open(rule_path, "wb") as fd:
+                fd.write(b"column_id: ChargeType\ncheck:\n  data_type: string\n")
+            rule = Rule.load_yaml(rule_path)
+            self.assertEqual(rule.check, DataTypeCheck(data_type=DataTypes.STRING))
+
+            with open(rule_path, "wb") as fd:
+                fd.write(b"column_id: ChargeType\ncheck:\n  data_type: decimal\n")
+            rule = Rule.load_yaml(rule_path)
+            self.assertEqual(rule.check, DataTypeCheck(data_type=DataTypes.DECIMAL))
@@ -0,0 +1,398 @@
+import io
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from focus_validator.data_loaders.csv_data_loader import (
+    CSVDataLoader,
+    __read_csv_file__,
+)
+from focus_validator.exceptions import FocusNotImplementedError
+
+
+class TestCSVDataLoader(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # one directory for the class, each test writes its own file into it
+        cls.temp_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def __data_path__(self):
+        return os.path.join(self.temp_dir.name, f"{self._testMethodName}.csv")
+
+    def __generate_content__(self, rows):
+        return b"id,ChargeType,BillingPeriodStart\n" + b"".join(
+            b"%d,Usage,2023-01-01T00:00:00Z\n" % i for i in range(rows)
+        )
+
+    def __assert_same_as_pandas__(self, content: bytes):
+        data = CSVDataLoader(io.BytesIO(content)).load()
+        assert_frame_equal(data, pd.read_csv(io.BytesIO(content)))
+        return data
+
+    def test_load_sample_file(self):
+        data = CSVDataLoader("tests/samples/multiple_failure_examples.csv").load()
+        assert_frame_equal(
+            data, pd.read_csv("tests/samples/multiple_failure_examples.csv")
+        )
+
+    def test_load_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            CSVDataLoader(os.path.join(self.temp_dir.name, "missing.csv")).load()
+
+    def test_load_device_file(self):
+        with self.assertRaises(pd.errors.EmptyDataError):
+            CSVDataLoader(os.devnull).load()
+
+    def test_load_text_buffer(self):
+        data = CSVDataLoader(io.StringIO("a;b\n1;2\n"), delimiter=";").load()
+        self.assertEqual(data.to_dict(orient="records"), [{"a": 1, "b": 2}])
+
+    def test_load_same_file_twice(self):
+        first = CSVDataLoader(
+            "tests/samples/multiple_failure_examples.csv", cache=True
+        ).load()
+        first.loc[0, "ChargeType"] = "modified"
+
+        second = CSVDataLoader(
+            "tests/samples/multiple_failure_examples.csv", cache=True
+        ).load()
+        self.assertEqual(second["ChargeType"][0], "a")
+
+    def test_load_without_cache(self):
+        cache_info = __read_csv_file__.cache_info()
+        CSVDataLoader("tests/samples/multiple_failure_examples.csv").load()
+        self.assertEqual(__read_csv_file__.cache_info(), cache_info)
+
+    def test_load_modified_file(self):
+        data_path = self.__data_path__()
+
+        with open(data_path, "wb") as fd:
+            fd.write(b"ChargeType\nUsage\n")
+        data = CSVDataLoader(data_path, cache=True).load()
+        self.assertEqual(data["ChargeType"].tolist(), ["Usage"])
+
+        with open(data_path, "wb") as fd:
+            fd.write(b"ChargeType\nUsage\nTax\n")
+        data = CSVDataLoader(data_path, cache=True).load()
+        self.assertEqual(data["ChargeType"].tolist(), ["Usage", "Tax"])
+
+    def test_load_large_file(self):
+        data_path = self.__data_path__()
+
+        with open(data_path, "wb") as fd:
+            fd.write(self.__generate_content__(50000))
+        self.assertGreater(os.path.getsize(data_path), 1 << 20)
+
+        assert_frame_equal(CSVDataLoader(data_path).load(), pd.read_csv(data_path))
+
+    def test_load_large_file_not_loaded_the_same_by_pyarrow(self):
+        data_path = self.__data_path__()
+
+        with open(data_path, "wb") as fd:
+            fd.write(self.__generate_content__(50000) + b"0xa,Usage,2023-01-01\n")
+
+        data = CSVDataLoader(data_path).load()
+        assert_frame_equal(data, pd.read_csv(data_path))
+        self.assertEqual(data["id"].tolist()[-1], "0xa")
+
+    def test_load_file_open_for_writing(self):
+        data_path = self.__data_path__()
+
+        with open(data_path, "wb") as fd:
+            fd.write(b"ChargeType\nUsage\n")
+            fd.flush()
+            first = CSVDataLoader(data_path).load()
+
+            fd.write(b"Tax\n")
+            fd.flush()
+            second = CSVDataLoader(data_path).load()
+
+        self.assertEqual(first["ChargeType"].tolist(), ["Usage"])
+        self.assertEqual(second["ChargeType"].tolist(), ["Usage", "Tax"])
+
+    def test_load_keeps_datetime_values_as_strings(self):
+        data = self.__assert_same_as_pandas__(
+            b"BillingPeriodStart,BillingPeriodEnd,ChargeDate,Time\n"
+            b"2023-01-01T00:00:00Z,2023-02-01 00:00:00-08:00,2023-01-01,10:00:00\n"
+        )
+        self.assertEqual(
+            data.to_dict(orient="records"),
+            [
+                {
+                    "BillingPeriodStart": "2023-01-01T00:00:00Z",
+                    "BillingPeriodEnd": "2023-02-01 00:00:00-08:00",
+                    "ChargeDate": "2023-01-01",
+                    "Time": "10:00:00",
+                }
+            ],
+        )
+
+    def test_load_datetime_values_after_first_block(self):
+        content = b"id,ChargeDate\n" + b"1,\n" * 600000 + b"2,2023-01-01\n"
+        self.assertGreater(len(content), 1 << 20)
+
+        data = CSVDataLoader(io.BytesIO(content)).load()
+        assert_frame_equal(data, pd.read_csv(io.BytesIO(content), low_memory=False))
+        self.assertEqual(data["ChargeDate"].tolist()[-1], "2023-01-01")
+
+    def test_load_missing_values(self):
+        data = self.__assert_same_as_pandas__(
+            b"name,cost,flag,empty\nNULL,1,True,\n,,,\nx,2.5,false,\n"
+        )
+        self.assertIsInstance(data["name"][0], float)
+        self.assertEqual(data["cost"].dtype, np.float64)
+        self.assertEqual(data["empty"].dtype, np.float64)
+
+    def test_load_non_ascii_values(self):
+        self.__assert_same_as_pandas__("name\nJosé\n日本\n".encode())
+
+    def test_load_binary_data(self):
+        with self.assertRaises(UnicodeDecodeError):
+            CSVDataLoader(io.BytesIO(b"a,b\n\xff\xfe\x00\x01,2\n")).load()
+
+    def test_load_binary_data_after_head(self):
+        with self.assertRaises(UnicodeDecodeError):
+            CSVDataLoader(io.BytesIO(b"a\n" + b"x\n" * 5000 + b"\xff\xfe\n")).load()
+
+    def test_load_non_ascii_value_at_end_of_head(self):
+        content = b"name,value\n" + b"x" * 8177 + b",1\n" + "é,2\n".encode()
+        self.assertEqual(content.index("é".encode()), 8191)
+
+        data = self.__assert_same_as_pandas__(content)
+        self.assertEqual(data["name"].tolist()[-1], "é")
+
+    def test_load_duplicate_column_names(self):
+        data = self.__assert_same_as_pandas__(b"a,a,\n1,2,3\n")
+        self.assertEqual(list(data.columns), ["a", "a.1", "Unnamed: 2"])
+
+    def test_load_rows_with_extra_fields(self):
+        self.__assert_same_as_pandas__(b"a,b\n1,2,\n3,4,\n")
+
+    def test_load_integers_too_large_for_int64(self):
+        data = self.__assert_same_as_pandas__(b"id\n123456789012345678901234\n")
+        self.assertEqual(data["id"][0], "123456789012345678901234")
+
+    def test_load_hexadecimal_and_positive_numbers(self):
+        data = self.__assert_same_as_pandas__(b"SubAccountId,Quantity\n0xa,+10\n1,2\n")
+        self.assertEqual(data["SubAccountId"][0], "0xa")
+        self.assertEqual(data["Quantity"].dtype, np.int64)
+
+    def test_load_nan_spellings(self):
+        data = self.__assert_same_as_pandas__(
+            b"BilledCost,ListCost,ContractedCost\n1.5,1.5,1.5\nnAn,NAN,nan\n2.5,2,NaN\n"
+        )
+        self.assertEqual(data["BilledCost"].tolist(), ["1.5", "nAn", "2.5"])
+        self.assertEqual(data["ListCost"][1], "NAN")
+        self.assertEqual(data["ContractedCost"].dtype, np.float64)
+
+    def test_load_booleans_in_any_letter_case(self):
+        data = self.__assert_same_as_pandas__(b"a,b\ntRuE,True\nfAlse,false\n")
+        self.assertEqual(data["a"].tolist(), [True, False])
+        self.assertEqual(data["b"].dtype, bool)
+
+    def test_load_empty_file(self):
+        with self.assertRaises(pd.errors.EmptyDataError):
+            CSVDataLoader(io.BytesIO(b"")).load()
+
+    def test_load_from_buffer_position(self):
+        for engine in ["pyarrow", "pandas", "polars"]:
+            with self.subTest(engine=engine):
+                buffer = io.BytesIO(b"ignored\na,b\n1,2\n")
+                buffer.readline()
+
+                data = CSVDataLoader(buffer, engine=engine).load()
+                self.assertEqual(data.to_dict(orient="records"), [{"a": 1, "b": 2}])
+
+    def test_load_columns(self):
+        data = CSVDataLoader(io.BytesIO(b"a,b,c\n1,x,2.5\n"), columns=["c", "a"]).load()
+        self.assertEqual(list(data.columns), ["a", "c"])
+
+    def test_load_column_types(self):
+        data = CSVDataLoader(
+            io.BytesIO(b"a,b,c\n1,2,2.5\n"),
+            column_types={"a": "int32", "b": "str", "c": "float32"},
+        ).load()
+        self.assertEqual(data.dtypes.tolist(), [np.int32, object, np.float32])
+        self.assertEqual(data["b"][0], "2")
+
+    def test_load_file_columns_and_column_types(self):
+        data = CSVDataLoader(
+            "tests/samples/multiple_failure_examples.csv",
+            columns=["ChargeType"],
+            column_types={"ChargeType": "category"},
+        ).load()
+        self.assertEqual(list(data.columns), ["ChargeType"])
+        self.assertIsInstance(data["ChargeType"].dtype, pd.CategoricalDtype)
+
+    def test_load_category_column_types_from_buffer(self):
+        data = CSVDataLoader(
+            io.BytesIO(b"a,b\nx,1\n"), column_types={"a": "category"}
+        ).load()
+        self.assertIsInstance(data["a"].dtype, pd.CategoricalDtype)
+
+    def test_load_datetime_column_types(self):
+        # same as pandas, which expects parse_dates for these
+        with self.assertRaises(TypeError):
+            CSVDataLoader(
+                io.BytesIO(b"a\n2023-01-01\n"), column_types={"a": "datetime64[ns]"}
+            ).load()
+
+    def test_load_columns_not_in_file(self):
+        with self.assertRaises(ValueError):
+            CSVDataLoader(io.BytesIO(b"a,b\n1,2\n"), columns=["c"]).load()
+
+    def test_load_column_types_not_matching_values(self):
+        with self.assertRaises(ValueError):
+            CSVDataLoader(io.BytesIO(b"a\n1\nx\n"), column_types={"a": "int64"}).load()
+
+    def test_load_column_types_with_missing_values(self):
+        with self.assertRaises(ValueError):
+            CSVDataLoader(
+                io.BytesIO(b"a,b\n1,x\n,y\n"), column_types={"a": "int64"}
+            ).load()
+
+    def test_load_semicolon_delimited(self):
+        data = CSVDataLoader(io.BytesIO(b'a;b;c\n"x,y";2;3\n')).load()
+        self.assertEqual(data.to_dict(orient="records"), [{"a": "x,y", "b": 2, "c": 3}])
+
+    def test_load_tab_delimited(self):
+        data = CSVDataLoader(io.BytesIO(b"a\tb\n1\t2\n3\t4\n")).load()
+        self.assertEqual(list(data.columns), ["a", "b"])
+        self.assertEqual(len(data), 2)
+
+    def test_load_with_delimiter(self):
+        data = CSVDataLoader(io.BytesIO(b"a;b\n1;2\n"), delimiter=",").load()
+        self.assertEqual(list(data.columns), ["a;b"])
+
+    def test_load_iter(self):
+        content = b"id,value\n" + b"".join(b"%d,value_%d\n" % (i, i) for i in range(10))
+
+        chunks = list(CSVDataLoader(io.BytesIO(content)).load_iter(chunksize=4))
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+        assert_frame_equal(pd.concat(chunks), CSVDataLoader(io.BytesIO(content)).load())
+
+    def test_load_iter_text_buffer(self):
+        chunks = list(CSVDataLoader(io.StringIO("a\n1\n2\n")).load_iter(chunksize=1))
+        self.assertEqual([chunk["a"].tolist() for chunk in chunks], [[1], [2]])
+
+    def test_load_iter_file(self):
+        chunks = list(
+            CSVDataLoader("tests/samples/multiple_failure_examples.csv").load_iter(
+                chunksize=2
+            )
+        )
+        assert_frame_equal(
+            pd.concat(chunks),
+            pd.read_csv("tests/samples/multiple_failure_examples.csv"),
+        )
+
+    def test_load_with_engines(self):
+        for engine in ["pandas", "polars"]:
+            data = CSVDataLoader(
+                "tests/samples/multiple_failure_examples.csv", engine=engine
+            ).load()
+            assert_frame_equal(
+                data, pd.read_csv("tests/samples/multiple_failure_examples.csv")
+            )
+
+    def test_load_with_polars_engine_missing_values(self):
+        data = CSVDataLoader(
+            io.BytesIO(b"name,cost\nNULL,1\nx,\n"), engine="polars"
+        ).load()
+        self.assertIsInstance(data["name"][0], float)
+        self.assertEqual(data["cost"].dtype, np.float64)
+
+    def test_load_with_polars_engine_column_types(self):
+        data = CSVDataLoader(
+            io.BytesIO(b"a,b,c\n1,2,2.5\n"),
+            column_types={"a": "int32", "c": "float32", "d": "str"},
+            engine="polars",
+        ).load()
+        self.assertEqual(data.dtypes.tolist(), [np.int32, np.int64, np.float32])
+
+    def test_unknown_engine(self):
+        with self.assertRaises(FocusNotImplementedError):
+            CSVDataLoader("tests/samples/multiple_failure_examples.csv", engine="c")
+
+    def test_load_downcast(self):
+        content = b"id,ChargeType,cost\n" + b"".join(
+            b"%d,%s,%d.5\n" % (i, [b"Usage", b"Tax"][i % 2], i) for i in range(10000)
+        )
+
+        data = CSVDataLoader(io.BytesIO(content)).load()
+        downcast_data = CSVDataLoader(io.BytesIO(content), downcast=True).load()
+
+        self.assertEqual(downcast_data["id"].dtype, np.int16)
+        self.assertIsInstance(downcast_data["ChargeType"].dtype, pd.CategoricalDtype)
+        self.assertEqual(downcast_data["cost"].dtype, np.float64)
+        self.assertLess(
+            downcast_data.memory_usage(deep=True).sum(),
+            data.memory_usage(deep=True).sum() * 0.7,
+        )
+        assert_frame_equal(
+            downcast_data, data, check_dtype=False, check_categorical=False
+        )
+
+    def test_load_dataset(self):
+        data_path = self.__data_path__()
+        with open(data_path, "wb") as fd:
+            fd.write(self.__generate_content__(1000))
+
+        dataset = CSVDataLoader(data_path).load_dataset()
+        self.assertEqual(dataset.schema.field("BillingPeriodStart").type, "string")
+        self.assertEqual(dataset.count_rows(), 1000)
+
+        table = dataset.to_table(columns=["id"])
+        self.assertEqual(table.column_names, ["id"])
+        assert_frame_equal(table.to_pandas(), pd.read_csv(data_path, usecols=["id"]))
+
+    def test_load_dataset_differences_from_load(self):
+        data_path = self.__data_path__()
+        with open(data_path, "wb") as fd:
+            fd.write(
+                b"SubAccountId,Quantity,Cost,ChargeType,Empty\n"
+                b"0xa,+10,1.5,Usage,\n"
+                b"1,2,NAN,,\n"
+            )
+        loader = CSVDataLoader(data_path)
+
+        data = loader.load()
+        dataset_data = loader.load_dataset().to_table().to_pandas()
+
+        self.assertEqual(data["SubAccountId"].tolist(), ["0xa", "1"])
+        self.assertEqual(dataset_data["SubAccountId"].tolist(), [10, 1])
+        self.assertEqual(data["Quantity"].tolist(), [10, 2])
+        self.assertEqual(data["Quantity"].dtype, np.int64)
+        self.assertEqual(dataset_data["Quantity"].dtype, np.float64)
+        self.assertEqual(data["Cost"].tolist(), ["1.5", "NAN"])
+        self.assertEqual(dataset_data["Cost"][0], 1.5)
+        self.assertTrue(np.isnan(dataset_data["Cost"][1]))
+        self.assertIsInstance(data["ChargeType"][1], float)
+        self.assertIsNone(dataset_data["ChargeType"][1])
+        self.assertEqual(data["Empty"].dtype, np.float64)
+        self.assertEqual(dataset_data["Empty"].dtype, object)
+
+    def test_load_dataset_columns(self):
+        dataset = CSVDataLoader(
+            "tests/samples/multiple_failure_examples.csv", columns=["ChargeType"]
+        ).load_dataset()
+        self.assertEqual(dataset.schema.names, ["ChargeType"])
+
+    def test_load_dataset_category_column_types(self):
+        with self.assertRaises(FocusNotImplementedError):
+            CSVDataLoader(
+                "tests/samples/multiple_failure_examples.csv",
+                column_types={"ChargeType": "category"},
+            ).load_dataset()
+
+    def test_load_dataset_from_buffer(self):
+        with self.assertRaises(FocusNotImplementedError):
+            CSVDataLoader(io.BytesIO(b"a\n1\n")).load_dataset()
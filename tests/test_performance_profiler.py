@@ -4,8 +4,11 @@ import io
 import logging
 import os
 import pstats
+import tempfile
 import time
 import unittest
+
+import pytest
 from ddt import ddt, data, unpack
 
 from tests.samples.csv_random_data_generate_at_scale import generate_and_write_fake_focuses
@@ -14,6 +17,7 @@ from focus_validator.validator import Validator
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - [%(funcName)s] - %(message)s')
 
+@pytest.mark.slow
 @ddt
 class TestPerformanceProfiler(unittest.TestCase):
     
@@ -24,22 +28,22 @@ class TestPerformanceProfiler(unittest.TestCase):
             headers = ['ncalls', 'tottime', 'percall', 'cumtime', 'percall', 'filename:lineno(function)']
             w.writerow(headers)
         
-            # Write each row
-            for row in profiling_result.stats.items():
-                func_name, (cc, nc, tt, ct, callers) = row
-                w.writerow([nc, tt, tt/nc, ct, ct/cc, func_name])
+            # Write all rows in a single call
+            w.writerows(
+                [nc, tt, tt/nc, ct, ct/cc, func_name]
+                for func_name, (cc, nc, tt, ct, callers) in profiling_result.stats.items()
+            )
 
-    def execute_profiler(self, file_name, performance_threshold):
+    def execute_profiler(self, data_filename, performance_threshold, profile_file_name):
         # Set the environment variable for logging level
         env = os.environ.copy()
         env["LOG_LEVEL"] = "INFO"
 
-        # Get the current directory of this test file
-        test_dir = os.path.dirname(os.path.abspath(__file__))
+        # Get the root directory of the repository
         base_dir =  os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         version_set_path=os.path.join(base_dir, "focus_validator", "rules", "version_sets")
         validator = Validator(
-            data_filename=os.path.join(test_dir, '../' + file_name),
+            data_filename=data_filename,
             override_filename=None,
             rule_set_path=version_set_path,
             rules_version="0.5",
@@ -57,14 +61,13 @@ class TestPerformanceProfiler(unittest.TestCase):
         validator.validate()
         end_time = time.time()
         duration = end_time - start_time
-        logging.info(f"File: {file_name} Duration: {duration} seconds")
+        logging.info(f"File: {os.path.basename(data_filename)} Duration: {duration} seconds")
 
         # Stop the profiler
         profiler.disable()
 
         # Save profiling data to a file
         profiling_result = pstats.Stats(profiler)
-        profile_file_name = "profiling_data_" + file_name
         self.profile_to_csv(profiling_result, profile_file_name)
 
         # Optionally print out profiling report to the console
@@ -85,23 +88,22 @@ class TestPerformanceProfiler(unittest.TestCase):
         # ("fake_focuses10000.csv", 7.0, 10000, "validate_10000_records"),
         # ("fake_focuses5000.csv", 3.0, 5000, "validate_5000_records"),
         ("fake_focuses2000.csv", 3.0, 2000, "validate_2000_records"),
-        ("fake_focuses2000.csv", 3.0, 1000, "validate_1000_records")
+        ("fake_focuses1000.csv", 3.0, 1000, "validate_1000_records")
     )
     @unpack
     def test_param_validator_performance(self, file_name, performance_threshold, number_of_records, case_id):
-        with self.subTest(case_id=case_id):
-            # Set the environment variable for logging level
-            env = os.environ.copy()
-            env["LOG_LEVEL"] = "INFO"
+        # Set the environment variable for logging level
+        env = os.environ.copy()
+        env["LOG_LEVEL"] = "INFO"
 
-            logging.info("Generating file with {number_of_records} records.")
-            generate_and_write_fake_focuses(file_name, number_of_records)
-            self.execute_profiler(str(file_name), performance_threshold)
+        # Each case generates into its own directory so cases can run in parallel
+        # (pytest -n auto) without overwriting or removing each other's data
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_filename = os.path.join(temp_dir, file_name)
 
-            logging.info("Cleaning up test file.")
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            if os.path.exists(os.path.join(base_dir, file_name)):
-                os.remove(os.path.join(base_dir, file_name))
+            logging.info(f"Generating file with {number_of_records} records.")
+            generate_and_write_fake_focuses(data_filename, number_of_records)
+            self.execute_profiler(data_filename, performance_threshold, f"profiling_data_{case_id}.csv")
     
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
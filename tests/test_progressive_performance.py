@@ -4,12 +4,15 @@ import subprocess
 import time
 import unittest
 
+import pytest
+
 from tests.samples.csv_random_data_generate_at_scale import generate_and_write_fake_focuses
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - [%(funcName)s] - %(message)s')
 
 
+@pytest.mark.slow
 class TestProgressivePerformance(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -20,6 +23,7 @@ class TestProgressivePerformance(unittest.TestCase):
         cls.csv_filename_100000 = 'fake_focuses100000.csv'
         cls.csv_filename_250000 = 'fake_focuses250000.csv'
         cls.csv_filename_500000 = 'fake_focuses500000.csv'
+        cls.generated_files = set()
 
         logging.info("Generating file with 1,000 records")
         cls.generate_test_file(str(cls.csv_filename_1000), 1000)
@@ -42,27 +46,12 @@ class TestProgressivePerformance(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
-        if os.path.exists(os.path.join(base_dir, 'fake_focuses.csv')):
-            os.remove(os.path.join(base_dir, 'fake_focuses.csv'))
 
-        if os.path.exists(os.path.join(base_dir, str(cls.csv_filename_1000))):
-            os.remove(os.path.join(base_dir, str(cls.csv_filename_1000)))
-        
-        if os.path.exists(os.path.join(base_dir, str(cls.csv_filename_10000))):
-            os.remove(os.path.join(base_dir, str(cls.csv_filename_10000)))
-        
-        if os.path.exists(os.path.join(base_dir, str(cls.csv_filename_50000))):
-            os.remove(os.path.join(base_dir, str(cls.csv_filename_50000)))
-        
-        if os.path.exists(os.path.join(base_dir, str(cls.csv_filename_100000))):
-            os.remove(os.path.join(base_dir, str(cls.csv_filename_100000)))
-        
-        if os.path.exists(os.path.join(base_dir, str(cls.csv_filename_250000))):
-            os.remove(os.path.join(base_dir, str(cls.csv_filename_250000)))
-        
-        if os.path.exists(os.path.join(base_dir, str(cls.csv_filename_500000))):
-            os.remove(os.path.join(base_dir, str(cls.csv_filename_500000)))
+        for csv_filename in cls.generated_files:
+            try:
+                os.remove(os.path.join(base_dir, str(csv_filename)))
+            except FileNotFoundError:
+                pass
     
     @classmethod
     def generate_test_file(cls, csv_filename, number_of_records):
@@ -71,6 +60,7 @@ class TestProgressivePerformance(unittest.TestCase):
 
         # write_fake_focuses_to_csv(fake_focuses, csv_filename)
         generate_and_write_fake_focuses(csv_filename, number_of_records)
+        cls.generated_files.add(csv_filename)
     
     
     def run_validator(self, args):
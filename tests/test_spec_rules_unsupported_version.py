@@ -6,11 +6,12 @@ from focus_validator.rules.spec_rules import SpecRules
 
 class TestSpecRulesUnsupportedVersion(TestCase):
     def test_load_unsupported_version(self):
-        with self.assertRaises(UnsupportedVersion) as cm:
+        with self.assertRaisesRegex(
+            UnsupportedVersion, r"^FOCUS version 0\.1 not supported\.$"
+        ):
             SpecRules(
                 column_namespace=None,
                 rule_set_path="focus_validator/rules/version_sets",
                 rules_version="0.1",
                 override_filename=None,
             )
-        self.assertEqual("FOCUS version 0.1 not supported.", str(cm.exception))
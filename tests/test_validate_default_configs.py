@@ -1,12 +1,9 @@
 import os
-import re
-from itertools import groupby
 from unittest import TestCase
 
 import pandas as pd
 
-from focus_validator.config_objects import ChecklistObjectStatus, Rule
-from focus_validator.config_objects.common import DataTypeCheck, DataTypes
+from focus_validator.config_objects import ChecklistObjectStatus
 from focus_validator.rules.spec_rules import SpecRules
 
 